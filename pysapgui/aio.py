@@ -0,0 +1,202 @@
+import asyncio
+import pythoncom
+import win32com.client as client
+from functools import partial
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pysapgui.element import Element
+
+
+class SapExecutor:
+    """
+    Thread pool for running blocking SAP GUI Scripting calls off the caller's thread.
+
+    Every worker thread is initialized as its own COM single-threaded apartment.
+    COM objects are bound to the apartment that created them, so work submitted here
+    must either create its own Session/Connection inside the worker, or go through
+    `call_async`, which marshals the element into the worker apartment.
+
+    Calls issued against the same SAP session are still serialized by SAP GUI;
+    the gain comes from overlapping calls on different sessions or connections.
+
+    Attributes:
+        executor (ThreadPoolExecutor): The underlying thread pool.
+    """
+    def __init__(self, max_workers: Optional[int] = None):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='pysapgui',
+            initializer=pythoncom.CoInitialize
+        )
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Schedules a callable to run on a worker apartment.
+
+        Args:
+            fn (Callable): The callable to run.
+            *args (Any): Positional arguments for the callable.
+            **kwargs (Any): Keyword arguments for the callable.
+
+        Returns:
+            Future: A future resolving to the callable's return value.
+        """
+        return self.executor.submit(fn, *args, **kwargs)
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Runs a callable on a worker apartment and awaits its result.
+
+        Args:
+            fn (Callable): The callable to run.
+            *args (Any): Positional arguments for the callable.
+            **kwargs (Any): Keyword arguments for the callable.
+
+        Returns:
+            Any: The callable's return value.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(fn, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts the thread pool down.
+
+        Args:
+            wait (bool): If True, blocks until pending calls have finished. Defaults to True.
+        """
+        self.executor.shutdown(wait=wait)
+
+
+_default_executor: Optional[SapExecutor] = None
+
+
+def get_default_executor() -> SapExecutor:
+    """
+    Returns the shared SapExecutor, creating it on first use.
+
+    Returns:
+        SapExecutor: The executor used when no other executor is given.
+    """
+    global _default_executor
+
+    if _default_executor is None:
+        _default_executor = SapExecutor()
+
+    return _default_executor
+
+
+async def call_async(
+    element: 'Element',
+    method: str,
+    *args: Any,
+    executor: Optional[SapExecutor] = None,
+    **kwargs: Any
+) -> Any:
+    """
+    Calls an Element method on a worker apartment and awaits its result.
+
+    The element's COM object is marshaled into the worker apartment, so the call
+    is valid even though the element was created on the caller's thread.
+
+    Args:
+        element (Element): The element to call the method on.
+        method (str): The name of the Element method (e.g. 'click', 'fill').
+        *args (Any): Positional arguments for the method.
+        executor (Optional[SapExecutor]): The executor to use. Defaults to the shared executor.
+        **kwargs (Any): Keyword arguments for the method.
+
+    Returns:
+        Any: The method's return value.
+    """
+    from pysapgui.element import Element
+
+    stream = pythoncom.CoMarshalInterThreadInterfaceInStream(
+        pythoncom.IID_IDispatch,
+        element.element._oleobj_
+    )
+
+    def invoke() -> Any:
+        dispatch = pythoncom.CoGetInterfaceAndReleaseStream(stream, pythoncom.IID_IDispatch)
+        worker_element = Element(element.session, client.Dispatch(dispatch))
+        return getattr(worker_element, method)(*args, **kwargs)
+
+    return await (executor or get_default_executor()).run(invoke)
+
+
+def read_rows_parallel(
+    targets: Sequence[tuple[int, str]],
+    column_limit: Optional[int] = None,
+    return_empty_rows: bool = False,
+    connection_id: Optional[int] = None
+) -> list[list[dict[Any, Any]]]:
+    """
+    Reads the rows of several tables at once, one worker thread per SAP session.
+    
+    SAP GUI serializes the calls made to a single session, so targets on the same
+    session are read one after the other by the same worker, while different sessions
+    are read in parallel. Each worker opens its own Connection and Session inside its
+    COM apartment; no COM object is shared between threads.
+    
+    Args:
+        targets (Sequence[tuple[int, str]]): Pairs of (session ID, element ID) of the tables to read.
+        column_limit (Optional[int]): The maximum number of columns to return for each row.
+        return_empty_rows (bool): If True, includes empty rows. Defaults to False.
+        connection_id (Optional[int]): The SAP connection holding the sessions. Defaults to the last one.
+    
+    Returns:
+        list[list[dict[Any, Any]]]: The rows of each target, as yielded by `Element.each_row_dict`,
+            in the same order as `targets`.
+    """
+    # Índices dos alvos agrupados por sessão: um worker por sessão
+    groups: dict[int, list[int]] = {}
+    
+    for index, (session_id, _) in enumerate(targets):
+        groups.setdefault(session_id, []).append(index)
+        
+    if not groups:
+        return []
+    
+    results: list[list[dict[Any, Any]]] = [[] for _ in targets]
+    executor = SapExecutor(max_workers=len(groups))
+    
+    try:
+        futures = {
+            session_id: executor.submit(
+                _read_session_rows,
+                connection_id,
+                session_id,
+                [targets[index][1] for index in indexes],
+                column_limit,
+                return_empty_rows
+            )
+            for session_id, indexes in groups.items()
+        }
+        
+        for session_id, future in futures.items():
+            for index, rows in zip(groups[session_id], future.result()):
+                results[index] = rows
+                
+    finally:
+        executor.shutdown()
+        
+    return results
+
+
+def _read_session_rows(
+    connection_id: Optional[int],
+    session_id: int,
+    element_ids: Sequence[str],
+    column_limit: Optional[int],
+    return_empty_rows: bool
+) -> list[list[dict[Any, Any]]]:
+    from pysapgui.session import Session
+    from pysapgui.connection import Connection
+    
+    session = Session(session_id, Connection(connection_id))
+    return [
+        list(session.find_element(element_id).each_row_dict(column_limit, return_empty_rows))
+        for element_id in element_ids
+    ]
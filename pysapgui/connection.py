@@ -1,9 +1,12 @@
 import win32com.client as client
-from typing import Optional, Any, TYPE_CHECKING
+from contextlib import contextmanager
+from typing import Optional, Any, Generator, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pysapgui.session import Session
 
+from pysapgui.tree_cache import TreeCache
+from pysapgui.message_filter import MessageFilter, install_message_filter, message_filter
 from pysapgui.exceptions import UnableToConnectException, NoSapConnectionException
 
 
@@ -17,17 +20,40 @@ class Connection:
     Attributes:
         ScriptingEngine (client.CDispatch): The scripting engine for SAP GUI.
         connection (client.CDispatch): The current SAP connection.
+        tree_cache (TreeCache): Snapshots of element subtrees taken through this connection.
+    
+    The COM message filter is thread-wide state, so a connection leaves it alone unless
+    asked: with `retry_rejected_calls`, pysapgui's MessageFilter is registered for the
+    calling thread, so calls rejected by a busy SAP GUI are retried instead of failing.
+    It stays registered until `message_filter.uninstall_message_filter` is called from
+    the same thread. To scope it to a block instead, use the `message_filter.message_filter`
+    context manager.
     """
-    def __init__(self, connection_id: Optional[int] = None):
+    def __init__(self, connection_id: Optional[int] = None, retry_rejected_calls: bool = False):
+        if retry_rejected_calls:
+            install_message_filter()
+            
         self.ScriptingEngine = self.__get_scripting_engine()
         self.connection = self.__get_connection(connection_id)
         self.connection_id = connection_id
+        self.tree_cache = TreeCache()
+        self._id = None
+        self._sessions: dict[int, 'Session'] = {}
     
     def __getattr__(self, name: Any) -> Any:
         return getattr(self.connection, name)
     
     def __eq__(self, value: object) -> bool:
-        return isinstance(value, Connection) and self.get_id() == value.get_id()
+        if self is value:
+            return True
+        
+        if not isinstance(value, Connection):
+            return False
+        
+        return self.connection is value.connection or self.get_id() == value.get_id()
+    
+    def __hash__(self) -> int:
+        return hash(self.get_id())
     
     def __get_scripting_engine(self) -> client.CDispatch:
         try:
@@ -43,13 +69,13 @@ class Connection:
         if not connections_length:
             raise NoSapConnectionException
         
-        if connection_id is not None:
-            if (connection_id < 0) or (connections_length < connection_id):
-                raise NoSapConnectionException(connection_id)
-
-            return connections.Item(connection_id)
+        if connection_id is None:
+            return connections.Item(connections_length - 1)
         
-        return connections.Item(connections_length - 1)
+        if not 0 <= connection_id < connections_length:
+            raise NoSapConnectionException(connection_id)
+
+        return connections.Item(connection_id)
     
     def get_id(self) -> str:
         """
@@ -58,26 +84,58 @@ class Connection:
         Returns:
             str: The ID of the current SAP connection.
         """
-        return self.connection.Id
+        if self._id is None:
+            self._id = self.connection.Id
+        
+        return self._id
     
     def refresh(self) -> None:
         """
         Refresh the current SAP connection.
         
-        This method retrieves the current connection again to ensure it is up-to-date.
+        This method retrieves the current connection again to ensure it is up-to-date,
+        discarding every cached element subtree and session wrapper.
         """
         self.connection = self.__get_connection(self.connection_id)
+        self.tree_cache.clear()
+        self._sessions.clear()
+        self._id = None
+    
+    @contextmanager
+    def batch_mode(self) -> Generator[None, None, None]:
+        """
+        Retries calls rejected by a busy SAP GUI immediately for longer while the block runs.
+        
+        Useful around bulk operations (filling grids, reading large tables), where SAP GUI
+        is usually busy only briefly. Immediate retries are bounded to the first half second
+        of each call; after that the minimum delay between retries applies.
+        """
+        with message_filter(MessageFilter(retry_delay=MessageFilter.MIN_RETRY_DELAY, backoff_after=500)):
+            yield
     
     def get_session(self, session_id: Optional[int] = None) -> 'Session':
         """
         Get the current SAP session.
         
+        Session wrappers are reused per session ID until the connection is refreshed.
+        Without a session ID, the first session that is not busy is looked up on every call.
+        
         Args:
-            session_id (Optional[int]): The ID of the SAP session to retrieve. If None, retrieves the last active session.
+            session_id (Optional[int]): The ID of the SAP session to retrieve. If None, retrieves the first session that is not busy.
         
         Returns:
             Session: An instance of the Session class representing the current SAP session.
         """
         from pysapgui.session import Session
-        return Session(session_id, self)
+        
+        # Qual sessão está livre muda com o tempo, então a escolha automática não é guardada
+        if session_id is None:
+            return Session(None, self)
+        
+        session = self._sessions.get(session_id)
+        
+        if session is None:
+            session = self._sessions[session_id] = Session(session_id, self)
+        
+        return session
     
\ No newline at end of file
@@ -1,15 +1,48 @@
 import re
-import win32com.client as client
-from typing import Optional, Any, Union, Literal, Sequence, Generator, TYPE_CHECKING
+import operator
+import functools
+import collections.abc
+from types import MethodType
+from typing import Optional, Any, Union, Literal, Iterable, Sequence, Generator, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from pysapgui.item_element import ItemElement
+    import win32com.client as client
+    from pysapgui.session import Session
+    from pysapgui.item_element import ItemElement, GridViewElement, TableTreeElement
+    from pysapgui.tree_cache import TreeNode
+    from pysapgui.aio import SapExecutor
 
-from pysapgui.session import Session
-from pysapgui.utils import search_path, check_element_attribute
+from pysapgui.utils import get_element_at, iter_collection, check_element_attribute, unique_keys
 from pysapgui.exceptions import SapAttributeNotFoundException
 
 
+_COLUMN_RE = re.compile(r'[^/]\[(\d+)\s*,\s*\d+]+$')
+_ROW_RE = re.compile(r'[^/]\[\d+\s*,\s*(\d+)]+$')
+
+# Tipos que apenas agrupam outros elementos e nunca representam uma célula
+_CONTAINER_TYPES = frozenset({
+    'GuiSimpleContainer',
+    'GuiScrollContainer',
+    'GuiCustomControl',
+    'GuiContainerShell',
+    'GuiSplitterContainer',
+    'GuiTabStrip',
+    'GuiTab',
+    'GuiUserArea',
+    'GuiToolbar',
+    'GuiMenubar',
+    'GuiStatusbar',
+    'GuiTitlebar',
+})
+
+
+@functools.lru_cache(maxsize=None)
+def _item_element_classes() -> tuple[type['GridViewElement'], type['TableTreeElement']]:
+    # item_element importa este módulo, então a importação só pode ocorrer na primeira chamada
+    from pysapgui.item_element import GridViewElement, TableTreeElement
+    return GridViewElement, TableTreeElement
+
+
 class Element:
     """
     Represents a SAP GUI element.
@@ -22,6 +55,22 @@ class Element:
         session (Session): The SAP session associated with this element.
         element (client.CDispatch): The underlying COM object representing the SAP GUI element.
     """
+    __slots__ = (
+        'session', 'element', '_id', '_type', '_attr_cache',
+        '_caps', '_scrollbar', '_node', '_column_title', '__weakref__'
+    )
+    
+    _get_id = staticmethod(operator.attrgetter('Id'))
+    _get_type = staticmethod(operator.attrgetter('Type'))
+    _get_text = staticmethod(operator.attrgetter('text'))
+    _get_tooltip = staticmethod(operator.attrgetter('tooltip'))
+    
+    # Capacidades (atributos presentes) por (Type, SubType) do elemento SAP, compartilhadas entre instâncias
+    _TYPE_CAPS: dict[tuple[str, Optional[str]], dict[str, bool]] = {}
+    
+    # Tipos cujas instâncias expõem interfaces diferentes conforme o SubType
+    _POLYMORPHIC_TYPES = frozenset({'GuiShell'})
+    
     @staticmethod
     def each_table_row(
         parent: 'Element',
@@ -31,50 +80,134 @@ class Element:
         """
         Yields each row as a list of GuiTableControl.
         """
+        session = parent.session
         table = parent.element
-        columns_count = table.Columns.Count
-        
-        if column_limit is not None:
-            columns_count = min(columns_count, column_limit)
+        table_columns, titles = Element.__get_table_columns(table, column_limit)
 
         for row in range(table.Rows.Count):
             row_elements = []
             
-            for column in range(columns_count):
+            for table_column, title in zip(table_columns, titles):
                 try:
-                    cell = table.Columns.elementAt(column).elementAt(row)
-                    cell_element = Element(parent.session, cell)
-                    try:
-                        cell_element.set_column_title(table.Columns.elementAt(column).Title)
-                    except Exception:
-                        pass
-                    row_elements.append(cell_element)
-                    
+                    cell_element = Element(session, table_column.elementAt(row))
                 except Exception:
                     continue
+                
+                cell_element._column_title = title
+                row_elements.append(cell_element)
 
-            if not return_empty_rows:
-                if all(
-                    (getattr(cell, 'get_text', lambda: '')() == '' or getattr(cell, 'get_text', lambda: None)() is None)
-                    for cell in row_elements
-                ):
-                    continue
+            if not return_empty_rows and not any(cell.get_text() for cell in row_elements):
+                continue
 
             if not row_elements:
                 break
             
             yield row_elements
         
-    def __init__(self, session: Session, element: client.CDispatch):
+    @staticmethod
+    def each_table_row_dict(
+        parent: 'Element',
+        column_limit: Optional[int] = None,
+        return_empty_rows: bool = False
+    ) -> Generator[dict[Any, Any], None, None]:
+        """
+        Yields each row of a GuiTableControl as a dict mapping column titles to cell texts.
+        
+        Columns without a readable title, or whose title repeats an earlier column's,
+        are keyed by their index.
+        """
+        table = parent.element
+        table_columns, titles = Element.__get_table_columns(table, column_limit)
+        keys = unique_keys(titles, range(len(titles)))
+
+        for row in range(table.Rows.Count):
+            row_dict = {}
+            
+            for table_column, key in zip(table_columns, keys):
+                try:
+                    row_dict[key] = table_column.elementAt(row).text
+                except Exception:
+                    continue
+
+            if not return_empty_rows and not any(row_dict.values()):
+                continue
+
+            if not row_dict:
+                break
+            
+            yield row_dict
+    
+    @staticmethod
+    def __get_table_columns(table: 'client.CDispatch', column_limit: Optional[int]) -> tuple[list, list]:
+        columns = table.Columns
+        columns_count = columns.Count
+        
+        if column_limit is not None:
+            columns_count = min(columns_count, column_limit)
+        
+        # Colunas e títulos são lidos uma única vez, não a cada célula
+        table_columns = [columns.elementAt(column) for column in range(columns_count)]
+        titles = []
+        
+        for table_column in table_columns:
+            try:
+                titles.append(table_column.Title)
+            except Exception:
+                titles.append(None)
+                
+        return table_columns, titles
+        
+    def __init__(self, session: 'Session', element: 'client.CDispatch'):
         self.session = session
         self.element = element
-        self.__column_title = None
+        self._id = None
+        self._type = None
+        self._attr_cache = {}
+        self._caps = None
+        self._scrollbar = None
+        self._node = None
+        self._column_title = None
+        
+    def _rebind(self, element: 'client.CDispatch') -> None:
+        """
+        Points this wrapper at a fresh COM object for the same element ID.
+        
+        Only the ID is kept. The same ID can hold a different control on another screen
+        (e.g. a shell that is a GridView here and a Toolbar there), so the type,
+        capabilities and column title are read again, and anything bound to the previous
+        COM object (methods, scrollbar, tree snapshot) is dropped.
+        
+        Args:
+            element (client.CDispatch): The new COM object of the SAP element.
+        """
+        self.element = element
+        self._type = None
+        self._attr_cache = {}
+        self._caps = None
+        self._scrollbar = None
+        self._node = None
+        self._column_title = None
         
     def __getattr__(self, name: Any) -> Any:
+        # Sondagens de protocolo do Python (__len__, __deepcopy__, ...) não vão ao COM
+        if name[:2] == '__' and name[-2:] == '__':
+            raise AttributeError(name)
+        
+        try:
+            return self._attr_cache[name]
+        except KeyError:
+            pass
+        
         try:
-            return getattr(self.element, name)
+            value = getattr(self.element, name)
         except AttributeError as e:
             raise SapAttributeNotFoundException(name) from e
+        
+        # Apenas métodos são memorizados; propriedades mudam a cada leitura
+        if isinstance(value, MethodType):
+            self._attr_cache[name] = value
+        
+        return value
     
     def __eq__(self, value: object) -> bool:
         return isinstance(value, Element) and (
@@ -82,6 +215,43 @@ class Element:
             self.get_type() == value.get_type()
         )
     
+    def __hash__(self) -> int:
+        return hash((self.get_id(), self.get_type()))
+    
+    def __get_caps(self) -> dict[str, bool]:
+        if self._caps is None:
+            element_type = self.get_type()
+            subtype = None
+            
+            # Todo shell (GridView, Tree, Toolbar, TextEdit...) tem Type "GuiShell"; só o SubType
+            # separa as interfaces. Sem SubType legível, as sondagens ficam nesta instância
+            if element_type in Element._POLYMORPHIC_TYPES:
+                try:
+                    subtype = str(self.element.SubType)
+                except Exception:
+                    self._caps = {}
+                    return self._caps
+            
+            self._caps = Element._TYPE_CAPS.setdefault((element_type, subtype), {})
+        
+        return self._caps
+    
+    def __has(self, name: str) -> bool:
+        caps = self.__get_caps()
+        
+        try:
+            return caps[name]
+        except KeyError:
+            pass
+        
+        try:
+            getattr(self.element, name)
+            caps[name] = True
+        except AttributeError:
+            caps[name] = False
+        
+        return caps[name]
+    
     def get_id(self) -> str:
         """
         Returns the ID of the SAP element.
@@ -91,7 +261,10 @@ class Element:
         Returns:
             str: The ID of the SAP element.
         """
-        return str(self.element.Id)
+        if self._id is None:
+            self._id = str(self._get_id(self.element))
+        
+        return self._id
     
     def get_type(self) -> str:
         """
@@ -102,7 +275,10 @@ class Element:
         Returns:
             str: The type of the SAP element.
         """
-        return str(self.element.Type)
+        if self._type is None:
+            self._type = str(self._get_type(self.element))
+        
+        return self._type
     
     @check_element_attribute
     def get_column_title(self) -> str:
@@ -114,10 +290,10 @@ class Element:
         Returns:
             str: The title of the SAP element.
         """
-        if not self.__title:
+        if not self._column_title:
             raise SapAttributeNotFoundException("Title")
         
-        return str(self.__column_title)
+        return str(self._column_title)
     
     def set_column_title(self, column_title: str) -> None:
         """
@@ -128,7 +304,7 @@ class Element:
         Args:
             title (str): The new title for the SAP element.
         """
-        self.__column_title = column_title
+        self._column_title = column_title
     
     @check_element_attribute
     def get_text(self) -> str:
@@ -140,7 +316,7 @@ class Element:
         Returns:
             str: The text of the SAP element.
         """
-        return str(self.element.text)
+        return str(self._get_text(self.element))
     
     @check_element_attribute
     def fill(self, value: Any) -> None:
@@ -163,6 +339,60 @@ class Element:
         """
         self.element.press()
     
+    @staticmethod
+    @check_element_attribute
+    def fill_many(pairs: Iterable[tuple['Element', Any]]) -> None:
+        """
+        Fills several SAP elements with their values in a single loop.
+        
+        Prefer this over calling `fill` per element when populating grids or forms,
+        since it skips the per-call decorator and wrapper overhead.
+        
+        Args:
+            pairs (Iterable[tuple[Element, Any]]): The elements to fill and the value for each one.
+        """
+        for element, value in pairs:
+            element.element.text = value
+    
+    @staticmethod
+    @check_element_attribute
+    def click_many(elements: Iterable['Element']) -> None:
+        """
+        Simulates a click on several SAP elements in a single loop.
+        
+        Args:
+            elements (Iterable[Element]): The elements to click, in order.
+        """
+        for element in elements:
+            element.element.press()
+    
+    async def fill_async(self, value: Any, executor: Optional['SapExecutor'] = None) -> None:
+        """
+        Fills the SAP element with the given value without blocking the event loop.
+        
+        The call runs on a SapExecutor worker apartment, so fills on different
+        sessions can be awaited together with `asyncio.gather`.
+        
+        Args:
+            value (Any): The value to fill in the SAP element.
+            executor (Optional[SapExecutor]): The executor to use. Defaults to the shared executor.
+        """
+        from pysapgui.aio import call_async
+        await call_async(self, 'fill', value, executor=executor)
+    
+    async def click_async(self, executor: Optional['SapExecutor'] = None) -> None:
+        """
+        Simulates a click on the SAP element without blocking the event loop.
+        
+        The call runs on a SapExecutor worker apartment, so clicks on different
+        sessions can be awaited together with `asyncio.gather`.
+        
+        Args:
+            executor (Optional[SapExecutor]): The executor to use. Defaults to the shared executor.
+        """
+        from pysapgui.aio import call_async
+        await call_async(self, 'click', executor=executor)
+    
     @check_element_attribute
     def set_focus(self) -> None:
         """
@@ -182,7 +412,8 @@ class Element:
         Args:
             key (Any): The key to select in the SAP element. Defaults to None.
         """
-        self.element.select(key) if key else self.element.select()
+        select = self.element.select
+        select(key) if key else select()
 
     @check_element_attribute
     def set_key(self, key: Any) -> None:
@@ -200,7 +431,7 @@ class Element:
         
         This is useful for getting additional information about the element.
         """
-        return self.element.tooltip
+        return self._get_tooltip(self.element)
     
     @check_element_attribute     
     def is_selected(self) -> bool:
@@ -210,9 +441,9 @@ class Element:
         Returns:
             bool: True if the element is selected, False otherwise.
         """
-        if hasattr(self.element, "Selected"):
+        if self.__has("Selected"):
             return self.element.Selected
-        elif hasattr(self.element, "Checked"):
+        elif self.__has("Checked"):
             return self.element.Checked
         raise SapAttributeNotFoundException("Selected/Checked")
     
@@ -226,10 +457,14 @@ class Element:
         Raises:
             SapAttributeNotFoundException: If the element does not have a 'Selected' or 'Checked' attribute.
         """
-        if hasattr(self.element, "Selected"):
+        if self.__has("Selected"):
             self.element.Selected = True
-        elif hasattr(self.element, "Checked"):
+            return
+        
+        if self.__has("Checked"):
             self.element.Checked = True
+            return
+        
         raise SapAttributeNotFoundException("Selected/Checked")
     
     @check_element_attribute
@@ -242,10 +477,18 @@ class Element:
         Raises:
             SapAttributeNotFoundException: If the element does not have a 'Selected' or 'Checked' attribute.
         """
-        if hasattr(self.element, "Selected"):
-            self.element.Selected = not self.element.Selected
-        elif hasattr(self.element, "Checked"):
-            self.element.Checked = not self.element.Checked
+        element = self.element
+        
+        if self.__has("Selected"):
+            selected = element.Selected
+            element.Selected = not selected
+            return
+        
+        if self.__has("Checked"):
+            checked = element.Checked
+            element.Checked = not checked
+            return
+        
         raise SapAttributeNotFoundException("Selected/Checked")
 
     @check_element_attribute
@@ -262,17 +505,47 @@ class Element:
         return Element(self.session, parent_element)
     
     @check_element_attribute
-    def get_children(self) -> list['Element']:
+    def get_children(self, deep: bool = False) -> Sequence['Element']:
         """
         Returns the children of the SAP element.
         
         This is useful for navigating the SAP GUI hierarchy.
         
+        Args:
+            deep (bool): 
+                If True, snapshots the whole subtree once in the connection's TreeCache,
+                so the IDs, types and children of the returned elements are served from memory.
+                Elements obtained from a snapshot keep navigating through it with `deep=True`
+                while it is still cached for the current screen. Defaults to False.
+        
         Returns:
-            list[Element]: A list of child elements wrapped in Element instances.
-        """
-        children = self.element.Children
-        return [Element(self.session, child) for child in children]
+            Sequence[Element]: 
+                The child elements wrapped in Element instances. Without `deep`, the sequence is lazy:
+                each wrapper is only built when its position is first accessed.
+        """
+        if not deep:
+            return _ChildList(self.session, self.element.Children)
+        
+        session = self.session
+        tree_cache = session.connection.tree_cache
+        
+        # Snapshot de outra tela (ou de antes de uma navegação) é descartado
+        if self._node is None or not tree_cache.holds(self._node):
+            self._node = tree_cache.get(
+                self.get_id(), 
+                self.element, 
+                session._get_screen_signature(), 
+                session.findById
+            )
+        
+        return [self.__wrap_node(node) for node in self._node.children]
+    
+    def __wrap_node(self, node: 'TreeNode') -> 'Element':
+        element = Element(self.session, node.element)
+        element._id = node.id
+        element._type = node.type
+        element._node = node
+        return element
     
     @check_element_attribute
     def get_column(self) -> int:
@@ -284,11 +557,10 @@ class Element:
         Returns:
             int: The column index of the element.
         """
-        if hasattr(self.element, "Column"):
+        if self.__has("Column"):
             return self.element.Column
         
-        column_pattern = re.compile(r'[^/]\[(\d+)\s*,\s*\d+]+$')
-        column_match = column_pattern.search(self.id)
+        column_match = _COLUMN_RE.search(self.get_id())
         
         if column_match:
              column = column_match.group(1)
@@ -306,11 +578,10 @@ class Element:
         Returns:
             int: The row index of the element.
         """
-        if hasattr(self.element, "Row"):
+        if self.__has("Row"):
             return self.element.Row
         
-        row_pattern = re.compile(r'[^/]\[\d+\s*,\s*(\d+)]+$')
-        row_match = row_pattern.search(self.id)
+        row_match = _ROW_RE.search(self.get_id())
         
         if row_match:
              row = row_match.group(1)
@@ -328,7 +599,24 @@ class Element:
         Returns:
             bool: True if the element is scrollable, False otherwise.
         """
-        return hasattr(self.element, 'verticalScrollbar')
+        return self.__has('verticalScrollbar')
+    
+    def __get_scrollbar(self) -> 'client.CDispatch':
+        if self._scrollbar is None:
+            caps = self.__get_caps()
+            
+            if caps.get('verticalScrollbar') is False:
+                raise SapAttributeNotFoundException("verticalScrollbar")
+            
+            try:
+                self._scrollbar = self.element.verticalScrollbar
+            except AttributeError as e:
+                caps['verticalScrollbar'] = False
+                raise SapAttributeNotFoundException("verticalScrollbar") from e
+            
+            caps['verticalScrollbar'] = True
+        
+        return self._scrollbar
     
     @check_element_attribute
     def get_scroll_position(self, max_or_min: Optional[Literal['max', 'min']] = None):
@@ -344,10 +632,7 @@ class Element:
         Raises:
             SapAttributeNotFoundException: If the element does not have a vertical scrollbar.
         """
-        if not self.is_scrollable():
-            raise SapAttributeNotFoundException("verticalScrollbar")
-        
-        scrollbar = self.element.verticalScrollbar
+        scrollbar = self.__get_scrollbar()
         
         if max_or_min == 'min':
             return scrollbar.minimum
@@ -374,29 +659,25 @@ class Element:
             SapAttributeNotFoundException: If the element does not have a vertical scrollbar.
             ValueError: If the direction is not 'up' or 'down'.
         """
-        if not self.is_scrollable():
-            raise SapAttributeNotFoundException("verticalScrollbar")
-        
-        current_position = self.get_scroll_position()
-        max_position = self.get_scroll_position(max_or_min='max')
-        min_position = self.get_scroll_position(max_or_min='min')
+        scrollbar = self.__get_scrollbar()
+        current_position = scrollbar.position
         
         if direction == 'up':
             new_position = current_position - amount
             
-            if new_position < min_position:
+            if new_position < scrollbar.minimum:
                 return False
             
         elif direction == 'down':
             new_position = current_position + amount
             
-            if new_position > max_position:
+            if new_position > scrollbar.maximum:
                 return False
             
         else:
             raise ValueError("Direction must be 'up' or 'down'.")
         
-        self.element.verticalScrollbar.position = new_position
+        scrollbar.position = new_position
         return True
     
     @check_element_attribute
@@ -413,33 +694,47 @@ class Element:
         Raises:
             SapAttributeNotFoundException: If the element does not have a vertical scrollbar.
         """
-        if not self.is_scrollable():
-            raise SapAttributeNotFoundException("verticalScrollbar")
-        
-        self.element.verticalScrollbar.position = position
+        self.__get_scrollbar().position = position
     
-    def find_partial_element(self, re_element_id: str) -> Optional['Element']:
+    def find_partial_element(self, re_element_id: str, breadth_first: bool = False) -> Optional['Element']:
         """
         Finds a child element using a partial (regex) path.
 
         Args:
             re_element_id (str): The partial or regex path of the child element.
+            breadth_first (bool): If True, each path segment resolves to the shallowest matching
+                element instead of the first one in tree order. Defaults to False.
 
         Returns:
             Optional[Element]: The first matching child element wrapped in an Element instance, or None if not found.
         """
-        results = search_path(
-            self.element,
-            re_path=re_element_id,
-            return_all=False,
-            element_wrapper=lambda elem: Element(self.session, elem)
-        )
-        return results if isinstance(results, Element) else None
+        return self.find_partial_elements([re_element_id], breadth_first)[re_element_id]
+    
+    def find_partial_elements(
+        self, 
+        re_element_ids: Sequence[str], 
+        breadth_first: bool = False
+    ) -> dict[str, Optional['Element']]:
+        """
+        Finds several child elements using partial (regex) paths, walking the subtree once.
+        
+        Elements resolved earlier are reused until the session is refreshed.
+
+        Args:
+            re_element_ids (Sequence[str]): The partial or regex paths of the child elements.
+            breadth_first (bool): If True, each path segment resolves to the shallowest matching
+                element instead of the first one in tree order. Defaults to False.
+
+        Returns:
+            dict[str, Optional[Element]]: Each path mapped to its first matching child element, or None if not found.
+        """
+        return self.session._find_partial(self.element, self.get_id(), re_element_ids, breadth_first)
           
     def each_row(
         self, 
         column_limit: Optional[int] = None, 
-        return_empty_rows: bool = True
+        return_empty_rows: bool = True,
+        bulk_read: bool = False
     ) -> Generator[Union[Sequence['Element'], Sequence['ItemElement']], None, None]:
         """
         Iterates over each row of the current SAP element, yielding either ItemElement
@@ -471,13 +766,19 @@ class Element:
             return_empty_rows (bool): 
                 If True, includes empty rows in the iteration.
                 If False, skips rows where all cells are empty or blank.
+            bulk_read (bool): 
+                If True, GridView controls are read in a single call (SelectAll + GetSelectedText)
+                when supported, falling back to per-cell reads otherwise. The grid selection
+                is changed while reading; the selected rows and columns and the current cell
+                are restored afterwards. Grids with individually selected cells are always
+                read cell by cell, so that selection is kept.
         
         Yields:
             Sequence[Element] or Sequence[ItemElement]: 
                 For each row, yields a sequence (usually a list) of Element or ItemElement 
                 instances representing the cells of that row.
         """
-        from pysapgui.item_element import GridViewElement, TableTreeElement
+        GridViewElement, TableTreeElement = _item_element_classes()
         
         element_text = self.get_text()
         element_type = self.get_type()
@@ -486,7 +787,8 @@ class Element:
             yield from GridViewElement.each_row(
                 parent=self, 
                 column_limit=column_limit, 
-                return_empty_rows=return_empty_rows
+                return_empty_rows=return_empty_rows,
+                bulk_read=bulk_read
             )
             
         elif 'TableTreeCtrl' in element_text:
@@ -503,32 +805,124 @@ class Element:
                 return_empty_rows=return_empty_rows
             )
         
-        yield from self.__rows_generator(
-            column_limit=column_limit, 
-            remove_empty_rows=not return_empty_rows
-        )
+        else:
+            yield from self.__rows_generator(
+                column_limit=column_limit, 
+                remove_empty_rows=not return_empty_rows
+            )
+        
+    def each_row_dict(
+        self, 
+        column_limit: Optional[int] = None, 
+        return_empty_rows: bool = True,
+        bulk_read: bool = False
+    ) -> Generator[dict[Any, Any], None, None]:
+        """
+        Iterates over each row of the current SAP element, yielding a dict per row.
+        
+        Works like `each_row`, but reads the cell texts straight from the control and
+        maps them by column, without building an Element or ItemElement per cell:
+        
+        - GridView rows are keyed by the displayed column titles.
+        - TableTree rows are keyed by the column titles.
+        - GuiTableControl rows are keyed by the column titles.
+        - Other elements are keyed by the column index of each child.
+        
+        A column whose title repeats an earlier one is keyed by its column ID, name or
+        index instead, so no cell is dropped.
+        
+        Args:
+            column_limit (Optional[int]): 
+                The maximum number of columns to return for each row. 
+                If None, returns all columns.
+            return_empty_rows (bool): 
+                If True, includes empty rows in the iteration.
+                If False, skips rows where all cells are empty or blank.
+            bulk_read (bool): 
+                If True, GridView controls are read in a single call (SelectAll + GetSelectedText)
+                when supported, falling back to per-cell reads otherwise. The grid selection
+                is changed while reading; the selected rows and columns and the current cell
+                are restored afterwards. Grids with individually selected cells are always
+                read cell by cell, so that selection is kept.
         
-    def __rows_generator(self, column_limit: Optional[int] = None, remove_empty_rows: bool = True):
-        rows = {}
+        Yields:
+            dict[Any, Any]: For each row, the cell texts indexed by column.
+        """
+        GridViewElement, TableTreeElement = _item_element_classes()
+        
+        element_text = self.get_text()
+        element_type = self.get_type()
+        
+        if 'GridViewCtrl' in element_text:
+            yield from GridViewElement.each_row_dict(
+                parent=self, 
+                column_limit=column_limit, 
+                return_empty_rows=return_empty_rows,
+                bulk_read=bulk_read
+            )
+            
+        elif 'TableTreeCtrl' in element_text:
+            yield from TableTreeElement.each_row_dict(
+                parent=self, 
+                column_limit=column_limit, 
+                return_empty_rows=return_empty_rows
+            )
+        
+        elif 'GuiTableControl' in element_type:
+            yield from Element.each_table_row_dict(
+                parent=self, 
+                column_limit=column_limit, 
+                return_empty_rows=return_empty_rows
+            )
+        
+        else:
+            for row in self.__rows_generator(
+                column_limit=column_limit, 
+                remove_empty_rows=not return_empty_rows,
+                with_columns=True
+            ):
+                yield {column: element.get_text() for column, element in row}
+        
+    def __rows_generator(
+        self, 
+        column_limit: Optional[int] = None, 
+        remove_empty_rows: bool = True, 
+        with_columns: bool = False
+    ):
+        # Índice = número da linha; None marca linhas que não apareceram
+        rows: list[Optional[list[tuple[int, Element]]]] = []
 
         for element in self.get_children():
+            # O tipo já é lido para o cache de capacidades, então o filtro não custa chamadas extras
+            if element.get_type() in _CONTAINER_TYPES:
+                continue
+            
             try:
                 r = element.get_row()
                 c = element.get_column()
             except Exception:
                 continue
 
-            if r not in rows:
+            while len(rows) <= r:
+                rows.append(None)
+            
+            if rows[r] is None:
                 rows[r] = []
             
             # Considera elementos sem texto como "vazios" (opcional: ajuste conforme seu critério de vazio)
             if not getattr(element, "text", None):
                 continue
 
-            rows[r].append(element)
+            rows[r].append((c, element))
 
-        for r in sorted(rows.keys()):
-            row_elems = sorted(rows[r], key=lambda e: e.get_column())
+        for row in rows:
+            if row is None:
+                continue
+            
+            # Os filhos costumam vir em ordem de coluna, então a ordenação é praticamente linear
+            row.sort(key=operator.itemgetter(0))
+            # Com with_columns, cada item já traz a coluna lida acima, junto do elemento
+            row_elems = row if with_columns else [element for _, element in row]
             
             # Aqui sim, fazemos o slice para limitar o número de colunas retornadas!
             if column_limit is not None:
@@ -537,4 +931,46 @@ class Element:
             if remove_empty_rows and not row_elems:
                 continue
 
-            yield row_elems
\ No newline at end of file
+            yield row_elems
+
+
+class _ChildList(collections.abc.Sequence):
+    """
+    Lazy sequence over the children of a SAP element.
+    
+    Element wrappers are built, and memoized, only for the positions actually accessed,
+    so callers that need a handful of children out of a wide container pay for those only.
+    """
+    def __init__(self, session: 'Session', collection: 'client.CDispatch'):
+        self.session = session
+        self.collection = collection
+        self.__element_at = get_element_at(collection)
+        self.__elements: list[Optional[Element]] = [None] * collection.Count
+    
+    def __len__(self) -> int:
+        return len(self.__elements)
+    
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.__elements)))]
+        
+        element = self.__elements[index]
+        
+        if element is None:
+            if index < 0:
+                index += len(self.__elements)
+            
+            element = self.__elements[index] = Element(self.session, self.__element_at(index))
+        
+        return element
+    
+    def __iter__(self):
+        elements = self.__elements
+        
+        for index, child in enumerate(iter_collection(self.collection)):
+            element = elements[index]
+            
+            if element is None:
+                element = elements[index] = Element(self.session, child)
+            
+            yield element
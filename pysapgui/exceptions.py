@@ -15,7 +15,7 @@ class UnableToConnectException(Exception):
 class NoSapConnectionException(Exception):
     """Exception raised when no SAP connection is found."""
     def __init__(self, connection_id: Optional[int] = None):
-        if connection_id:
+        if connection_id is not None:
             message = (
                 f"No SAP connection with ID '{connection_id}' found. "
                 "Please ensure that you have an active SAP connection."
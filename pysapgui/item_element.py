@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from pysapgui.element import Element
-from typing import Any, Generator, Sequence, Optional
+from pysapgui.utils import has_text, iter_collection, unique_keys
+from typing import Any, Callable, Generator, Iterator, Sequence, Optional
 
 from pysapgui.exceptions import (
     TableTreeSelectAllNotSupportedException,
@@ -8,6 +9,23 @@ from pysapgui.exceptions import (
 )
 
 
+class _RowTexts(dict):
+    # Textos de uma linha indexados pela coluna, lidos do controle só no primeiro acesso
+    __slots__ = ('_load',)
+    
+    def __init__(self, load: Callable[[], dict[Any, Any]]) -> None:
+        super().__init__()
+        self._load = load
+    
+    def __missing__(self, key: Any) -> Any:
+        if self._load is None:
+            raise KeyError(key)
+        
+        load, self._load = self._load, None
+        self.update(load())
+        return self[key]
+
+
 class ItemElement(ABC):
     """
     Represents a generic item element within a SAP GUI structure.
@@ -23,16 +41,19 @@ class ItemElement(ABC):
     Attributes:
         (To be defined in subclasses according to the specific SAP GUI control type.)
     """ 
+    __slots__ = ('row', 'col', 'parent', '_texts')
     
     @staticmethod
     @abstractmethod
     def each_row(parent: Element, column_limit: Optional[int] = None, return_empty_rows: bool = True) -> Generator[Sequence['ItemElement'], None, None]:
         ...
     
-    def __init__(self, parent: Element, row: Any, col: Any) -> None:
+    def __init__(self, parent: Element, row: Any, col: Any, texts: Optional[dict] = None) -> None:
         self.row = row
         self.col = col
         self.parent = parent
+        # Textos da linha já lidos do controle, indexados pela coluna
+        self._texts = texts
     
     @abstractmethod
     def get_header(self) -> str:
@@ -122,31 +143,148 @@ class GridViewElement(ItemElement):
     This class extends ItemElement to provide specific behaviors and attributes
     for grid view items, such as selecting rows, columns, and handling text content.
     """
+    __slots__ = ()
         
     @staticmethod
-    def each_row(parent: Element, column_limit: Optional[int] = None, return_empty_rows: bool = True) -> Generator[Sequence['GridViewElement'], None, None]:
+    def each_row(
+        parent: Element, 
+        column_limit: Optional[int] = None, 
+        return_empty_rows: bool = True, 
+        bulk_read: bool = False
+    ) -> Generator[Sequence['GridViewElement'], None, None]:
         """
         Yields each row as a list of GridViewElement.
+        
+        Cell values are read once per row, on the first `get_text` of any of its elements,
+        unless skipping empty rows requires reading them up front.
+        
+        With `bulk_read`, the whole grid is read in a single call (SelectAll + GetSelectedText)
+        when the control supports it. This changes the grid selection while reading; the
+        selected rows and columns and the current cell are restored afterwards. Grids with
+        individually selected cells are read cell by cell instead, keeping that selection.
+        """
+        element = parent.element
+        column_ids = GridViewElement.__get_column_ids(element, column_limit)
+        
+        if return_empty_rows and not bulk_read:
+            get_cell_value = element.GetCellValue
+            
+            for row in range(element.RowCount):
+                texts = _RowTexts(lambda row=row: {
+                    column_id: get_cell_value(row, column_id) for column_id in column_ids
+                })
+                yield [GridViewElement(parent, row, column_id, texts) for column_id in column_ids]
+            return
+            
+        for row, values in enumerate(GridViewElement.__iter_row_texts(element, column_ids, bulk_read)):
+            if not return_empty_rows and not has_text(values):
+                continue
+                
+            texts = dict(zip(column_ids, values))
+            yield [GridViewElement(parent, row, column_id, texts) for column_id in column_ids]
+    
+    @staticmethod
+    def each_row_dict(
+        parent: Element, 
+        column_limit: Optional[int] = None, 
+        return_empty_rows: bool = True, 
+        bulk_read: bool = False
+    ) -> Generator[dict[str, Any], None, None]:
+        """
+        Yields each row as a dict mapping displayed column titles to cell values.
+        
+        Columns whose title repeats an earlier column's are keyed by their column ID.
+        `bulk_read` works as in `each_row`.
         """
         element = parent.element
-        columns_count = element.ColumnCount if column_limit is None else column_limit
+        column_ids = GridViewElement.__get_column_ids(element, column_limit)
+        get_column_title = element.GetDisplayedColumnTitle
+        titles = unique_keys([get_column_title(column_id) for column_id in column_ids], column_ids)
             
+        for texts in GridViewElement.__iter_row_texts(element, column_ids, bulk_read):
+            if not return_empty_rows and not has_text(texts):
+                continue
+                
+            yield dict(zip(titles, texts))
+    
+    @staticmethod
+    def __iter_row_texts(element: Any, column_ids: list[str], bulk_read: bool) -> Iterator[list[Any]]:
+        cells = GridViewElement.__read_all_cells(element) if bulk_read else None
+        
+        if cells is not None:
+            # As colunas do texto seguem a ordem de exibição, a mesma de column_ids
+            for row_cells in cells:
+                yield row_cells[:len(column_ids)]
+            return
+        
+        get_cell_value = element.GetCellValue
+        
         for row in range(element.RowCount):
-            row_elements = [
-                GridViewElement(parent, row, element.ColumnOrder.Item(col))
-                for col in range(columns_count)
-            ]
+            yield [get_cell_value(row, column_id) for column_id in column_ids]
+    
+    @staticmethod
+    def __read_all_cells(element: Any) -> Optional[list[list[str]]]:
+        # Lê a grade inteira em uma chamada; None se o controle não suportar ou o formato não bater
+        if not (hasattr(element, 'SelectAll') and hasattr(element, 'GetSelectedText')):
+            return None
+        
+        # Qualquer falha, inclusive ao ler ou restaurar a seleção, cai na leitura célula a célula
+        try:
+            # O formato esperado é lido antes de mexer na seleção
+            columns_count = element.ColumnCount
+            row_count = element.RowCount
             
-            if not return_empty_rows:
-                if all((cell.get_text() is None or str(cell.get_text()).strip() == "") for cell in row_elements):
-                    continue
+            if not row_count:
+                return []
+            
+            # Células selecionadas avulsas não têm como ser restauradas: a grade é lida célula a célula
+            if element.SelectedCells.Count:
+                return None
+            
+            selected_rows = element.SelectedRows
+            selected_columns = list(iter_collection(element.SelectedColumns))
+            current_cell = (element.CurrentCellRow, element.CurrentCellColumn)
+            
+            try:
+                element.SelectAll()
+                text = element.GetSelectedText()
+            finally:
+                element.ClearSelection()
+                element.SetCurrentCell(*current_cell)
                 
-            yield row_elements
+                if selected_rows:
+                    element.SelectedRows = selected_rows
+                    
+                for column in selected_columns:
+                    element.SelectColumn(column)
+            
+            cells = [line.split('\t') for line in str(text).splitlines()]
+        except Exception:
+            return None
+        
+        if len(cells) != row_count or any(len(row) != columns_count for row in cells):
+            return None
+        
+        return cells
+    
+    @staticmethod
+    def __get_column_ids(element: Any, column_limit: Optional[int]) -> list[str]:
+        columns_count = element.ColumnCount
+        
+        # Só as colunas dentro do limite são lidas do controle
+        if column_limit is not None:
+            columns_count = min(columns_count, column_limit)
+            
+        column_order = element.ColumnOrder
+        return [column_order.Item(col) for col in range(columns_count)]
     
     def get_header(self) -> str:
         return self.parent.GetDisplayedColumnTitle(self.col)
     
     def get_text(self) -> str:
+        if self._texts is not None:
+            return self._texts[self.col]
+        
         return self.parent.GetCellValue(self.row, self.col)
     
     def select(self) -> None:
@@ -156,7 +294,7 @@ class GridViewElement(ItemElement):
         self.parent.SelectColumn(self.col)
     
     def select_row(self) -> None:
-        self.parent.selectedRows = self.row # type: ignore[assignment]
+        self.parent.element.selectedRows = self.row
     
     def select_all(self) -> None:
         self.parent.SelectAll()
@@ -175,35 +313,73 @@ class TableTreeElement(ItemElement):
     This class extends ItemElement to provide specific behaviors and attributes
     for table tree items, such as selecting rows, columns, and handling text content.
     """
+    __slots__ = ()
     
     @staticmethod
     def each_row(parent: Element, column_limit: Optional[int] = None, return_empty_rows: bool = True) -> Generator[Sequence[ItemElement], None, None]:
         """
         Yields each row as a list of TableTreeElement.
+        
+        Item texts are read once per node, on the first `get_text` of any of its elements,
+        unless skipping empty rows requires reading them up front.
         """
         element = parent.element
-        column_names = list(element.GetColumnNames())
-        
-        if column_limit is not None:
-            column_names = column_names[:column_limit]
+        column_names = TableTreeElement.__get_column_names(element, column_limit)
+        get_item_text = element.GetItemText
 
         for row_key in element.GetAllNodeKeys():
-            row_elements = [
-                TableTreeElement(parent, row_key, col_name)
-                for col_name in column_names
-            ]
-
-            if not return_empty_rows:
+            load = lambda row_key=row_key: {
+                col_name: get_item_text(row_key, col_name) for col_name in column_names
+            }
+            
+            if return_empty_rows:
+                texts = _RowTexts(load)
+            else:
+                texts = load()
                 
-                if all((cell.get_text() is None or str(cell.get_text()).strip() == "") for cell in row_elements):
+                if not has_text(texts.values()):
                     continue
             
-            yield row_elements
+            yield [TableTreeElement(parent, row_key, col_name, texts) for col_name in column_names]
+    
+    @staticmethod
+    def each_row_dict(parent: Element, column_limit: Optional[int] = None, return_empty_rows: bool = True) -> Generator[dict[str, Any], None, None]:
+        """
+        Yields each row as a dict mapping column titles to item texts.
+        
+        Columns whose title repeats an earlier column's are keyed by their column name.
+        """
+        element = parent.element
+        column_names = TableTreeElement.__get_column_names(element, column_limit)
+        get_column_title = element.GetColumnTitleFromName
+        titles = unique_keys([get_column_title(col_name) for col_name in column_names], column_names)
+        get_item_text = element.GetItemText
+
+        for row_key in element.GetAllNodeKeys():
+            texts = [get_item_text(row_key, col_name) for col_name in column_names]
+
+            if not return_empty_rows and not has_text(texts):
+                continue
+            
+            yield dict(zip(titles, texts))
+    
+    @staticmethod
+    def __get_column_names(element: Any, column_limit: Optional[int]) -> list[str]:
+        column_names = list(element.GetColumnNames())
+        
+        if column_limit is not None:
+            # Corta antes da leitura dos textos, para não buscar colunas fora do limite
+            column_names = column_names[:column_limit]
+            
+        return column_names
     
     def get_header(self) -> str:
         return self.parent.GetColumnTitleFromName(self.col)
     
     def get_text(self) -> str:
+        if self._texts is not None:
+            return self._texts[self.col]
+        
         return self.parent.GetItemText(self.row, self.col)
     
     def select(self) -> None:
@@ -0,0 +1,155 @@
+import threading
+import pythoncom
+from contextlib import contextmanager
+from win32com.server.util import wrap
+from typing import Any, Generator
+
+
+SERVERCALL_ISHANDLED = 0
+SERVERCALL_RETRYLATER = 2
+PENDINGMSG_WAITDEFPROCESS = 2
+
+_thread_state = threading.local()
+
+
+class MessageFilter:
+    """
+    COM message filter tuned for SAP GUI Scripting calls.
+
+    OLE's default filter cancels any call that a busy SAP GUI rejects with
+    SERVERCALL_RETRYLATER, surfacing it as "Call was rejected by callee".
+    This filter retries those calls instead: immediately while the call is young,
+    then every `retry_delay` milliseconds until `timeout` is reached. Immediate
+    retries spin the calling thread, so that phase is kept short and the delay
+    after it never drops below MIN_RETRY_DELAY.
+
+    Whatever the filter does not handle itself (incoming calls, pending messages
+    and other kinds of rejection) is forwarded to the filter it replaced, if any;
+    if that filter fails, OLE's default answer is used instead.
+
+    Attributes:
+        retry_delay (int): Milliseconds to wait between retries once `backoff_after` has elapsed.
+        backoff_after (int): Milliseconds during which rejected calls are retried immediately.
+        timeout (int): Milliseconds after which a rejected call is cancelled.
+        previous (Any): The filter registered before this one, or None for OLE's default.
+    """
+    _public_methods_ = ['HandleInComingCall', 'RetryRejectedCall', 'MessagePending']
+    _com_interfaces_ = [pythoncom.IID_IMessageFilter]
+
+    MIN_RETRY_DELAY = 100
+
+    def __init__(self, retry_delay: int = 100, backoff_after: int = 100, timeout: int = 60000):
+        self.retry_delay = max(retry_delay, self.MIN_RETRY_DELAY)
+        self.backoff_after = backoff_after
+        self.timeout = timeout
+        self.previous = None
+
+    def HandleInComingCall(self, dwCallType: int, htaskCaller: int, dwTickCount: int, lpInterfaceInfo: Any) -> int:
+        if self.previous is not None:
+            try:
+                return self.previous.HandleInComingCall(dwCallType, htaskCaller, dwTickCount, lpInterfaceInfo)
+            except Exception:
+                pass
+
+        return SERVERCALL_ISHANDLED
+
+    def RetryRejectedCall(self, htaskCallee: int, dwTickCount: int, dwRejectType: int) -> int:
+        if dwRejectType != SERVERCALL_RETRYLATER:
+            if self.previous is not None:
+                try:
+                    return self.previous.RetryRejectedCall(htaskCallee, dwTickCount, dwRejectType)
+                except Exception:
+                    pass
+
+            return -1
+
+        if dwTickCount >= self.timeout:
+            return -1
+
+        # Valores abaixo de 100 fazem o COM repetir a chamada imediatamente (sem espera)
+        if dwTickCount < self.backoff_after:
+            return 0
+
+        return self.retry_delay
+
+    def MessagePending(self, htaskCallee: int, dwTickCount: int, dwPendingType: int) -> int:
+        if self.previous is not None:
+            try:
+                return self.previous.MessagePending(htaskCallee, dwTickCount, dwPendingType)
+            except Exception:
+                pass
+
+        return PENDINGMSG_WAITDEFPROCESS
+
+
+def register_message_filter(message_filter: MessageFilter) -> Any:
+    """
+    Registers a message filter for the calling thread's COM apartment.
+
+    The replaced filter is kept in `message_filter.previous`, so calls the new
+    filter does not handle still reach it.
+
+    Args:
+        message_filter (MessageFilter): The filter to register.
+
+    Returns:
+        Any: The previously registered filter, to be restored later (None for OLE's default).
+
+    Raises:
+        pythoncom.com_error: If the thread's apartment does not support message filters (MTA).
+    """
+    previous = pythoncom.CoRegisterMessageFilter(wrap(message_filter, pythoncom.IID_IMessageFilter))
+    message_filter.previous = previous
+    return previous
+
+
+def install_message_filter() -> bool:
+    """
+    Registers the default MessageFilter once per thread.
+
+    The filter already registered by the application is chained, not dropped, and
+    can be put back with `uninstall_message_filter`. Threads in the multithreaded
+    apartment do not support message filters; there the call does nothing.
+
+    Returns:
+        bool: True if the default filter is active for the calling thread.
+    """
+    if not hasattr(_thread_state, 'installed'):
+        try:
+            _thread_state.previous = register_message_filter(MessageFilter())
+            _thread_state.installed = True
+        except pythoncom.com_error:
+            _thread_state.installed = False
+
+    return _thread_state.installed
+
+
+def uninstall_message_filter() -> None:
+    """
+    Restores, for the calling thread, the filter replaced by `install_message_filter`.
+    """
+    if getattr(_thread_state, 'installed', False):
+        pythoncom.CoRegisterMessageFilter(_thread_state.previous)
+        del _thread_state.installed, _thread_state.previous
+
+
+@contextmanager
+def message_filter(filter_: MessageFilter) -> Generator[None, None, None]:
+    """
+    Temporarily registers a message filter, restoring the previous one on exit.
+
+    In threads that do not support message filters (MTA), the block runs unfiltered.
+
+    Args:
+        filter_ (MessageFilter): The filter to register while the block runs.
+    """
+    try:
+        previous = register_message_filter(filter_)
+    except pythoncom.com_error:
+        yield
+        return
+
+    try:
+        yield
+    finally:
+        pythoncom.CoRegisterMessageFilter(previous)
@@ -1,11 +1,12 @@
+import weakref
 import win32com.client as client
-from typing import Optional, Any, TYPE_CHECKING
+from typing import Optional, Any, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pysapgui.element import Element
 
 from pysapgui.connection import Connection
-from pysapgui.utils import search_path
+from pysapgui.utils import search_all, search_paths, search_path_bfs, literal_path, iter_collection
 from pysapgui.exceptions import NoSapSessionException, SapElementNotFoundException
 
 
@@ -20,16 +21,31 @@ class Session:
         session (client.CDispatch): The current SAP session.
         connection (Connection): The SAP connection object.
     """
+    __slots__ = (
+        'connection', 'session', 'session_id', '_main_window', '_element_cache',
+        '_partial_cache', 'findById', 'sendCommand', 'Id'
+    )
+    
     def __init__(
         self, 
         session_id: Optional[int] = None, 
         connection: Optional[Connection] = None
     ):
         self.connection = connection if connection else Connection()
-        self.session = self.__get_session(session_id)
+        self.__bind(self.__get_session(session_id))
         self.session_id = session_id
+        self._main_window = None
+        # Wrappers vivos indexados pelo ID do elemento, reaproveitados entre buscas
+        self._element_cache: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        # Elementos já resolvidos por caminho parcial, indexados por (ID da base, caminho, tela, modo de busca)
+        self._partial_cache: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
     
     def __getattr__(self, name: Any) -> Any:
+        # Slots ainda não preenchidos (ex.: durante o __init__) e sondagens de protocolo
+        # do Python não são repassados ao COM
+        if name in Session.__slots__ or (name[:2] == '__' and name[-2:] == '__'):
+            raise AttributeError(name)
+        
         return getattr(self.session, name)
     
     def __eq__(self, value: object) -> bool:
@@ -37,29 +53,56 @@ class Session:
     
     def __get_session(self, session_id: Optional[int]) -> client.CDispatch:
         sessions = self.connection.Sessions
-        sessions_length = sessions.Count
-        
-        if not sessions_length:
-            raise NoSapSessionException
         
         if session_id is not None:
-            if (session_id < 0) or (sessions_length <= session_id):
+            if session_id < 0:
                 raise NoSapSessionException(session_id)
             
-            session =sessions.Item(session_id)
+            # Índice fora do intervalo falha no próprio Item, sem consultar Count antes
+            try:
+                session = sessions.Item(session_id)
+            except Exception as e:
+                raise NoSapSessionException(session_id) from e
 
             if not session.Busy:
                 return session
             
             raise NoSapSessionException(session_id)
             
-        for idx in range(sessions_length):
-            session = sessions.Item(idx)
+        for session in iter_collection(sessions):
             if not session.Busy:
                 return session
         
         raise NoSapSessionException(session_id)
 
+    def __bind(self, session: client.CDispatch) -> None:
+        # Membros mais usados ficam no próprio objeto, sem passar pelo __getattr__
+        self.session = session
+        self.findById = session.findById
+        self.sendCommand = session.sendCommand
+        self.Id = session.Id
+
+    def __revalidate(self, element: 'Element') -> bool:
+        # Um findById pelo ID guardado: falha se o controle não existe mais na tela atual;
+        # se existe, o wrapper passa a apontar para o objeto COM vivo
+        try:
+            elem = self.findById(element.get_id())
+        except Exception:
+            return False
+        
+        if element.element is not elem:
+            element._rebind(elem)
+            
+        return True
+
+    def _get_screen_signature(self) -> Optional[tuple[str, int, str]]:
+        # Programa, número da tela e janela ativa mudam a cada navegação
+        try:
+            info = self.session.Info
+            return info.Program, info.ScreenNumber, self.session.ActiveWindow.Id
+        except Exception:
+            return None
+
     def get_id(self) -> str:
         """
         Get the ID of the current SAP session.
@@ -67,7 +110,20 @@ class Session:
         Returns:
             str: The ID of the current SAP session.
         """
-        return self.session.Id
+        return self.Id
+    
+    @property
+    def main_window(self) -> client.CDispatch:
+        """
+        The main window (wnd[0]) of the SAP session, looked up once and reused until refresh.
+        
+        Returns:
+            client.CDispatch: The main SAP GUI window.
+        """
+        if self._main_window is None:
+            self._main_window = self.findById("wnd[0]")
+            
+        return self._main_window
     
     def refresh(self) -> None:
         """
@@ -75,7 +131,10 @@ class Session:
         
         This method retrieves the current session again to ensure it is up-to-date.
         """
-        self.session = self.__get_session(self.session_id)
+        self.__bind(self.__get_session(self.session_id))
+        self._main_window = None
+        self._element_cache.clear()
+        self._partial_cache.clear()
         self.connection.refresh()
 
     def goto_tcode(self, tcode: str) -> None:
@@ -85,7 +144,8 @@ class Session:
         Args:
             tcode (str): The transaction code to navigate to.
         """        
-        self.session.sendcommand(tcode)
+        self.sendCommand(tcode)
+        self.connection.tree_cache.clear()
     
     def send_vkey(self, vkey: str) -> None:
         """
@@ -94,7 +154,8 @@ class Session:
         Args:
             vkey (str): The virtual key to send.
         """
-        self.session.findById("wnd[0]").sendVKey(vkey)
+        self.main_window.sendVKey(vkey)
+        self.connection.tree_cache.clear()
         
     def maximaze_window(self) -> None:
         """
@@ -102,8 +163,9 @@ class Session:
         
         This method sets focus on the main window and maximizes it.
         """
-        self._session.findById("wnd[0]").setFocus()
-        self._session.findById("wnd[0]").maximize()
+        window = self.main_window
+        window.setFocus()
+        window.maximize()
     
     def close_window(self) -> None:
         """
@@ -111,8 +173,11 @@ class Session:
         
         This method sets focus on the main window and closes it.
         """
-        self._session.findById("wnd[0]").setFocus()
-        self._session.findById("wnd[0]").close()
+        window = self.main_window
+        window.setFocus()
+        window.close()
+        self._main_window = None
+        self.connection.tree_cache.clear()
         
     def get_screen_region(self) -> tuple[int, int, int, int]:
         """
@@ -121,7 +186,7 @@ class Session:
         Returns:
             tuple[int, int, int, int]: A tuple containing the left, top, width, and height of the SAP GUI window.
         """
-        window = self._session.findById("wnd[0]")
+        window = self.main_window
         return window.ScreenLeft, window.ScreenTop, window.width, window.height
     
     def get_window_title(self) -> str:
@@ -131,7 +196,41 @@ class Session:
         Returns:
             str: The title of the SAP GUI window.
         """
-        return str(self._session.findById("wnd[0]").text)
+        return str(self.main_window.text)
+    
+    def _wrap(self, elem: client.CDispatch, element_id: Optional[str] = None) -> 'Element':
+        """
+        Wraps a COM object in an Element, reusing the live wrapper of the same element ID.
+        
+        Wrappers are only reused when the caller already knows the element ID (e.g. read
+        during a tree walk); reading it here would cost an extra COM call per lookup.
+        A reused wrapper is rebound to the new COM object, so every holder of it sees the
+        element currently at that ID, with its type and capabilities read again.
+        
+        Args:
+            elem (client.CDispatch): The COM object of the SAP element.
+            element_id (Optional[str]): The ID of the element, if already known.
+        
+        Returns:
+            Element: The wrapper for the element.
+        """
+        from pysapgui.element import Element
+        
+        if element_id is None:
+            return Element(self, elem)
+        
+        element_id = str(element_id)
+        element = self._element_cache.get(element_id)
+        
+        if element is None:
+            element = Element(self, elem)
+            element._id = element_id
+            self._element_cache[element_id] = element
+            
+        elif element.element is not elem:
+            element._rebind(elem)
+            
+        return element
     
     def find_element(self, element_id: str) -> 'Element':
         """
@@ -146,28 +245,143 @@ class Session:
         Raises:
             SapElementNotFoundException: If the element with the specified ID is not found.
         """
-        from pysapgui.element import Element
         try:
-            return Element(self, self.session.findById(element_id))
+            return self._wrap(self.findById(element_id))
         except Exception as e:
             raise SapElementNotFoundException(element_id) from e
     
-    def find_partial_element(self, re_element_id: str) -> Optional['Element']:
+    def find_partial_element(self, re_element_id: str, breadth_first: bool = False) -> Optional['Element']:
         """
         Finds an element in the SAP GUI session by a partial ID.
         
         Args:
             re_element_id (str): The partial ID of the element to find.
+            breadth_first (bool): If True, each path segment resolves to the shallowest matching
+                element instead of the first one in tree order. Defaults to False.
         
         Returns:
             Optional[Element]: The found SAP GUI element wrapped in an Element instance, or None if not found.
         """
-        from pysapgui.element import Element
-        results = search_path(
-            self.session,
-            re_path=re_element_id,
-            return_all=False,
-            element_wrapper=lambda elem: Element(self, elem)
+        return self.find_partial_elements([re_element_id], breadth_first)[re_element_id]
+    
+    def find_partial_elements(
+        self, 
+        re_element_ids: Sequence[str], 
+        breadth_first: bool = False
+    ) -> dict[str, Optional['Element']]:
+        """
+        Finds several elements in the SAP GUI session by partial IDs, walking the tree once.
+        
+        Args:
+            re_element_ids (Sequence[str]): The partial IDs of the elements to find.
+            breadth_first (bool): If True, each path segment resolves to the shallowest matching
+                element instead of the first one in tree order. Defaults to False.
+        
+        Returns:
+            dict[str, Optional[Element]]: Each partial ID mapped to its first matching element, or None if not found.
+        """
+        return self._find_partial(self.session, None, re_element_ids, breadth_first)
+    
+    def find_many(
+        self, 
+        patterns: Sequence[str], 
+        prune_matched_subtrees: bool = False
+    ) -> dict[str, list['Element']]:
+        """
+        Finds every element of the session matching each pattern, walking the tree once.
+        
+        Each pattern is a regex matched, case-insensitively, against the full ID of every
+        element; brackets are literal, as in `find_partial_element`.
+        
+        Args:
+            patterns (Sequence[str]): The patterns to look for.
+            prune_matched_subtrees (bool): If True, the descendants of an element matching a
+                pattern are not matched against that pattern again, and subtrees whose root
+                matched every pattern are not read at all. Defaults to False.
+        
+        Returns:
+            dict[str, list[Element]]: Each pattern mapped to all matching elements, in tree order.
+        """
+        return search_all(
+            self.session, 
+            patterns, 
+            element_wrapper=self._wrap, 
+            prune_matched_subtrees=prune_matched_subtrees
         )
-        return results if isinstance(results, Element) else None
-    
\ No newline at end of file
+    
+    def _find_partial(
+        self, 
+        base: client.CDispatch, 
+        base_id: Optional[str], 
+        re_element_ids: Sequence[str],
+        breadth_first: bool = False
+    ) -> dict[str, Optional['Element']]:
+        """
+        Resolves partial IDs below a base element.
+        
+        Paths without regex metacharacters are first tried with a single findById call;
+        the others reuse elements resolved earlier on the same screen, once a findById
+        confirms they still exist, or are searched for.
+        
+        Args:
+            base (client.CDispatch): The COM object to search from.
+            base_id (Optional[str]): The ID of the base element, or None for the session itself.
+            re_element_ids (Sequence[str]): The partial IDs of the elements to find.
+            breadth_first (bool): If True, searches breadth-first (see `search_path_bfs`).
+        
+        Returns:
+            dict[str, Optional[Element]]: Each partial ID mapped to its first matching element, or None if not found.
+        """
+        results = {}
+        pending = []
+        missing = []
+        
+        for re_element_id in re_element_ids:
+            element_id = literal_path(re_element_id)
+            
+            # Caminhos sem regex vão direto para o findById; se falhar, seguem para a busca
+            if element_id is not None:
+                try:
+                    results[re_element_id] = self._wrap(base.findById(element_id))
+                    continue
+                except Exception:
+                    pass
+                
+            pending.append(re_element_id)
+        
+        signature = self._get_screen_signature() if pending else None
+        
+        for re_element_id in pending:
+            key = (base_id, re_element_id, signature, breadth_first)
+            # Sem assinatura não há como saber se a tela mudou, então o cache é ignorado
+            element = None if signature is None else self._partial_cache.get(key)
+            
+            # A assinatura não muda com subtelas, abas ou um Enter que redesenha a mesma tela,
+            # então o elemento guardado é conferido antes de ser devolvido
+            if element is not None and not self.__revalidate(element):
+                self._partial_cache.pop(key, None)
+                element = None
+            
+            if element is None:
+                missing.append(re_element_id)
+            else:
+                results[re_element_id] = element
+        
+        if missing:
+            if breadth_first:
+                found = {}
+                
+                # A busca em largura é feita caminho a caminho
+                for re_element_id in missing:
+                    element = search_path_bfs(base, re_element_id, element_wrapper=self._wrap)
+                    found[re_element_id] = None if isinstance(element, list) else element
+            else:
+                found = search_paths(base, re_paths=missing, element_wrapper=self._wrap)
+            
+            for re_element_id, element in found.items():
+                if element is not None and signature is not None:
+                    self._partial_cache[(base_id, re_element_id, signature, breadth_first)] = element
+                    
+            results.update(found)
+        
+        return {re_element_id: results[re_element_id] for re_element_id in re_element_ids}
@@ -0,0 +1,111 @@
+from typing import Any, Callable, NamedTuple, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from win32com.client import CDispatch
+
+from pysapgui.utils import iter_collection
+
+
+class TreeNode(NamedTuple):
+    """
+    Snapshot of a single SAP GUI element taken by TreeCache.
+
+    Attributes:
+        id (str): The ID of the SAP element.
+        type (str): The type of the SAP element.
+        element (client.CDispatch): The underlying COM object of the SAP element.
+        children (list[TreeNode]): The snapshots of the element's children.
+        signature (Any): The screen the snapshot was taken on.
+    """
+    id: str
+    type: str
+    element: 'CDispatch'
+    children: list
+    signature: Any = None
+
+
+class TreeCache:
+    """
+    Caches snapshots of SAP GUI element subtrees.
+
+    Walking the SAP GUI hierarchy costs one cross-process COM call per property read.
+    This class walks a subtree once, keeping the ID, type and COM reference of every
+    node in memory, so further navigation over that subtree does not touch COM.
+
+    Snapshots are keyed by element ID and screen signature (program, screen number
+    and active window), since the same ID (e.g. wnd[0]/usr) exists on every screen.
+    Sessions also clear the cache when they navigate (see Session.goto_tcode).
+
+    Attributes:
+        nodes (dict[tuple[str, Any], TreeNode]): Every cached node, indexed by its element ID and screen signature.
+    """
+    def __init__(self):
+        self.nodes: dict[tuple[str, Any], TreeNode] = {}
+
+    def get(
+        self, 
+        element_id: str, 
+        element: 'CDispatch', 
+        signature: Any = None,
+        find_by_id: Optional[Callable[[str], 'CDispatch']] = None
+    ) -> TreeNode:
+        """
+        Returns the cached snapshot of an element, walking its subtree on a cache miss.
+
+        Without a signature the subtree is walked again and not cached.
+
+        Args:
+            element_id (str): The ID of the SAP element.
+            element (client.CDispatch): The COM object of the SAP element.
+            signature (Any): The signature of the current screen, or None if unknown.
+            find_by_id (Optional[Callable[[str], client.CDispatch]]): 
+                If given, a cached snapshot is only served if its root is still found by it.
+
+        Returns:
+            TreeNode: The snapshot of the element and all of its descendants.
+        """
+        node = self.nodes.get((element_id, signature)) if signature is not None else None
+
+        if node is not None and find_by_id is not None:
+            try:
+                find_by_id(element_id)
+            except Exception:
+                node = None
+
+        if node is None:
+            node = self.__walk(element, element_id, signature)
+
+        return node
+
+    def holds(self, node: TreeNode) -> bool:
+        """
+        Tells whether a snapshot is still the cached one for its element and screen.
+
+        Args:
+            node (TreeNode): The snapshot to check.
+
+        Returns:
+            bool: False if the cache was cleared or the element walked again since.
+        """
+        return node.signature is not None and self.nodes.get((node.id, node.signature)) is node
+
+    def clear(self) -> None:
+        """
+        Discards every cached snapshot.
+        """
+        self.nodes.clear()
+
+    def __walk(self, element: 'CDispatch', element_id: str, signature: Any) -> TreeNode:
+        children = []
+        collection = getattr(element, 'Children', None)
+
+        if collection is not None:
+            for child in iter_collection(collection):
+                children.append(self.__walk(child, str(child.Id), signature))
+
+        node = TreeNode(element_id, str(element.Type), element, children, signature)
+
+        if signature is not None:
+            self.nodes[(element_id, signature)] = node
+
+        return node
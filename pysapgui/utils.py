@@ -1,27 +1,51 @@
 import re
+import functools
+from collections import deque
 from pysapgui.exceptions import SapAttributeNotFoundException
-from typing import Any, Union, Optional, Callable, TYPE_CHECKING
+from typing import Any, Union, Optional, Callable, Iterable, Iterator, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from win32com.client import CDispatch
+
+
+# Colchete não escapado em um trecho do caminho (ex.: "wnd[0]")
+_BRACKET_RE = re.compile(r'(?<!\\)\[')
+
+# Metacaracteres de regex; colchetes ficam de fora porque a busca já os trata como literais
+_REGEX_META_RE = re.compile(r'[.*+?^${}()|\\]')
+
+# Todos os caracteres com significado especial em um padrão
+_REGEX_SPECIAL = frozenset('.^$*+?{}[]()|\\')
+
+# Nome do atributo na mensagem de AttributeError ("... has no attribute 'x'")
+_ATTR_MARKER = "has no attribute '"
+_ATTR_RE = re.compile(r"has no attribute '([^']+)'")
     
     
 def search_path(
     base_element: 'CDispatch', 
     re_path: str,
     return_all: bool = False,
-    element_wrapper: Any = None
+    element_wrapper: Any = None,
+    prune_matched_subtrees: bool = False
 ) -> list:
-    parts = re_path.split('/')
+    # Só o primeiro encadeamento importa: mesma busca usada por Session.find_partial_element
+    if not return_all:
+        found = search_paths(base_element, (re_path,))[re_path]
+        
+        if found is None:
+            return []
+        
+        return element_wrapper(found) if element_wrapper else found
+    
+    parts = _compile_path(re_path)
     current_level = [base_element]
-    results = []
     
-    for i, part in enumerate(parts):
+    for i, compiled in enumerate(parts):
         next_level = []
-        pattern = re.sub(r'(?<!\\)(\[)', r'\\[', part)
         
         for elem in current_level:
-            found = search_element(elem, pattern, (i == len(parts) - 1) and return_all)
+            found = search_element(elem, compiled, i == len(parts) - 1, prune_matched_subtrees)
             
             if found:
                 if isinstance(found, list):
@@ -33,56 +57,355 @@ def search_path(
             return []
         
         current_level = next_level
+    
+    # current_level já é uma lista nova desta chamada; só é copiada quando há wrapper
+    if not element_wrapper:
+        return current_level
+    
+    return [element_wrapper(elem) for elem in current_level]
         
-    for elem in current_level:
-        results.append(element_wrapper(elem) if element_wrapper else elem)
-        
-    if not return_all and results:
-        return results[0]
+
+def search_path_bfs(
+    base_element: 'CDispatch', 
+    re_path: str,
+    return_all: bool = False,
+    element_wrapper: Any = None,
+    max_window: int = 64
+) -> list:
+    # Igual a search_path, mas cada trecho é buscado em largura: o elemento mais raso que
+    # casa vence, o que pode diferir do primeiro em pré-ordem. Só é usada quando pedida
+    # explicitamente (breadth_first), nunca no lugar de search_path/search_paths
+    parts = _compile_path(re_path)
+    current_level = [base_element]
     
-    return results
+    for i, compiled in enumerate(parts):
+        next_level = []
+        collect_all = (i == len(parts) - 1) and return_all
         
+        for elem in current_level:
+            next_level.extend(search_element_bfs(elem, compiled, collect_all, max_window))
+            
+            if next_level and not collect_all:
+                break
+        
+        if not next_level:
+            return []
+        
+        current_level = next_level if collect_all else next_level[:1]
+        
+    if not return_all:
+        return element_wrapper(current_level[0]) if element_wrapper else current_level[0]
+    
+    return [element_wrapper(elem) if element_wrapper else elem for elem in current_level]
 
-def search_element(
+
+def search_element_bfs(
     element: 'CDispatch',
-    pattern: str,
+    compiled: re.Pattern,
     return_all: bool,
-) -> Optional[Union['CDispatch', list['CDispatch']]]:
+    max_window: int = 64
+) -> list['CDispatch']:
+    # Ordem sempre em largura; max_window só limita quantos IDs são testados antes de os
+    # filhos desses elementos serem lidos do COM, sem alterar o resultado
     found_elements = []
+    prefix = _literal_prefix(compiled.pattern)
+    frontier = deque(_child_list(element))
     
-    if hasattr(element, 'Children'):
-        try:
-            children_iter = iter(element.Children)
+    while frontier:
+        window = [frontier.popleft() for _ in range(min(max_window, len(frontier)))]
+        
+        for child in window:
+            cid = child.Id
             
-        except TypeError:
-            return None
-    
-        for child in children_iter:
-            if re.search(pattern, child.Id, re.IGNORECASE):
+            if (not prefix or prefix in cid.lower()) and compiled.search(cid):
                 if not return_all:
-                    return child
+                    return [child]
                 
                 found_elements.append(child)
-                    
-            sub_found = search_element(child, pattern, return_all)
+        
+        for child in window:
+            frontier.extend(_child_list(child))
             
-            if sub_found:
-                if isinstance(sub_found, list):
-                    if not return_all:
-                        return sub_found[0]
-                    
-                    found_elements.extend(sub_found)
+    return found_elements
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_path(re_path: str) -> tuple[re.Pattern, ...]:
+    # Trechos do caminho já escapados e compilados; caminhos repetidos não passam pelo re de novo
+    return tuple(_compile_segment(part) for part in re_path.split('/'))
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_segment(part: str) -> re.Pattern:
+    return re.compile(_BRACKET_RE.sub(r'\\[', part), re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=512)
+def _literal_prefix(pattern: str) -> str:
+    # Trecho literal que abre o padrão, em minúsculas: todo ID que casa precisa contê-lo,
+    # então um "in" em C descarta a maioria dos elementos antes do motor de regex
+    if '|' in pattern:
+        return ''
+    
+    prefix = []
+    
+    for char in pattern:
+        if char in _REGEX_SPECIAL:
+            # Quantificador vale para o último caractere, que então pode não aparecer
+            if char in '*?{' and prefix:
+                prefix.pop()
+            break
+        
+        prefix.append(char)
+        
+    return ''.join(prefix).lower()
+
+
+def literal_path(re_path: str) -> Optional[str]:
+    # Devolve o ID exato quando o caminho não usa regex, ou None caso contrário
+    path = re_path.replace('\\[', '[').replace('\\]', ']')
+    return None if _REGEX_META_RE.search(path) else path
+
+
+def search_element(
+    element: 'CDispatch',
+    compiled: re.Pattern,
+    return_all: bool,
+    prune_matched_subtrees: bool = False,
+) -> Optional[Union['CDispatch', list['CDispatch']]]:
+    # Descendentes de um elemento encontrado não são examinados quando prune_matched_subtrees
+    descend = (lambda cid: not compiled.search(cid)) if prune_matched_subtrees else None
+    prefix = _literal_prefix(compiled.pattern)
+    matches = (
+        child for child, cid in _walk(element, descend)
+        if (not prefix or prefix in cid.lower()) and compiled.search(cid)
+    )
+    
+    if not return_all:
+        return next(matches, None)
+    
+    return list(matches)
+
 
+def _walk(
+    element: 'CDispatch', 
+    descend: Optional[Callable[[str], bool]] = None
+) -> Iterator[tuple['CDispatch', str]]:
+    # Pré-ordem com pilha explícita; cada elemento é entregue (com o Id lido uma única vez)
+    # antes de seus filhos serem lidos, então quem consome pode parar sem custo extra
+    stack = _child_list(element)
+    stack.reverse()
+    
+    while stack:
+        child = stack.pop()
+        cid = child.Id
+        yield child, cid
+        
+        if descend is None or descend(cid):
+            children = _child_list(child)
+            children.reverse()
+            stack.extend(children)
+
+
+def _child_list(element: 'CDispatch') -> list['CDispatch']:
+    children = getattr(element, 'Children', None)
+    
+    if children is None:
+        return []
+    
+    # Coleção lida em lotes pelo enumerador, com acesso por índice como alternativa
+    try:
+        return list(iter_collection(children))
+    except (TypeError, AttributeError):
+        return []
+
+
+def search_paths(
+    base_element: 'CDispatch',
+    re_paths: Iterable[str],
+    element_wrapper: Any = None
+) -> dict[str, Any]:
+    # Resolve vários caminhos de uma vez: a cada nível, caminhos que partem do mesmo
+    # elemento compartilham uma única varredura da subárvore. O element_wrapper recebe
+    # o elemento e o Id já lido na varredura
+    results = {re_path: None for re_path in re_paths}
+    pending = {re_path: _compile_path(re_path) for re_path in results}
+    current = {re_path: base_element for re_path in results}
+    level = 0
+    
+    while pending:
+        groups = {}
+        
+        for re_path, parts in pending.items():
+            node = current[re_path]
+            groups.setdefault(id(node), (node, {}))[1][re_path] = parts[level]
+        
+        next_pending = {}
+        
+        for node, patterns in groups.values():
+            found = search_elements(node, set(patterns.values()))
+            
+            for re_path, pattern in patterns.items():
+                if pattern not in found:
+                    continue
+                
+                match, match_id = found[pattern]
+                
+                if level == len(pending[re_path]) - 1:
+                    results[re_path] = element_wrapper(match, match_id) if element_wrapper else match
                 else:
-                    if not return_all:
-                        return sub_found
+                    current[re_path] = match
+                    next_pending[re_path] = pending[re_path]
                     
-                    found_elements.append(sub_found)
+        pending = next_pending
+        level += 1
+        
+    return results
+
+
+def search_elements(
+    element: 'CDispatch', 
+    patterns: Iterable[re.Pattern]
+) -> dict[re.Pattern, tuple['CDispatch', str]]:
+    # Mesma ordem de busca de search_element, mas testa todos os padrões em cada filho
+    # e para assim que todos tiverem sido encontrados; devolve o elemento e seu Id.
+    # O prefixo literal de cada padrão descarta a maioria dos filhos antes do regex
+    pending = {pattern: _literal_prefix(pattern.pattern) for pattern in patterns}
+    found = {}
+    
+    if not pending:
+        return found
+    
+    # Caso mais comum (um único caminho): sem dicionário de pendentes no laço
+    if len(pending) == 1:
+        (pattern, prefix), = pending.items()
+        
+        for child, child_id in _walk(element):
+            if (not prefix or prefix in child_id.lower()) and pattern.search(child_id):
+                found[pattern] = (child, child_id)
+                break
+            
+        return found
+    
+    # A tupla de pendentes só é refeita quando algum padrão é encontrado
+    items = tuple(pending.items())
+    
+    for child, child_id in _walk(element):
+        lowered = child_id.lower()
+        
+        for pattern, prefix in items:
+            if (not prefix or prefix in lowered) and pattern.search(child_id):
+                found[pattern] = (child, child_id)
+                del pending[pattern]
+                
+        if len(items) != len(pending):
+            if not pending:
+                break
+            
+            items = tuple(pending.items())
+        
+    return found
+
+
+def search_all(
+    base_element: 'CDispatch',
+    patterns: Iterable[str],
+    element_wrapper: Any = None,
+    prune_matched_subtrees: bool = False
+) -> dict[str, list[Any]]:
+    # Uma única varredura da subárvore, reunindo todos os elementos cujo ID casa com cada padrão.
+    # O element_wrapper recebe o elemento e o Id já lido na varredura
+    found: dict[str, list[Any]] = {pattern: [] for pattern in patterns}
+    filters = []
+    
+    for pattern, matches in found.items():
+        compiled = _compile_segment(pattern)
+        filters.append([matches, compiled, _literal_prefix(compiled.pattern), None])
+    
+    if not filters:
+        return found
+    
+    # Com prune_matched_subtrees, cada padrão ignora os descendentes do último elemento que
+    # casou (em pré-ordem eles vêm logo em seguida, com o Id dele como prefixo); a subárvore
+    # só deixa de ser lida quando todos os padrões casaram no mesmo elemento
+    matched_all = False
+    descend = (lambda cid: not matched_all) if prune_matched_subtrees else None
+    
+    for child, cid in _walk(base_element, descend):
+        lowered = cid.lower()
+        matched_all = True
+        
+        for entry in filters:
+            matches, compiled, prefix, pruned = entry
+            
+            if pruned is not None and cid.startswith(pruned):
+                continue
+            
+            if (not prefix or prefix in lowered) and compiled.search(cid):
+                matches.append(element_wrapper(child, cid) if element_wrapper else child)
+                
+                if prune_matched_subtrees:
+                    entry[3] = cid + '/'
+            else:
+                matched_all = False
                 
-    if return_all and found_elements:
-        return found_elements
+    return found
+
+
+def get_element_at(collection: 'CDispatch') -> Callable[[int], 'CDispatch']:
+    # ElementAt recebe um índice (Long) direto; Item aceita Variant e fica como alternativa
+    try:
+        return collection.ElementAt
+    except AttributeError:
+        return collection.Item
+
+
+def iter_collection(collection: 'CDispatch', batch_size: int = 64) -> Iterator['CDispatch']:
+    # Busca os itens em lotes pelo IEnumVARIANT (um Next por lote, não por item)
+    try:
+        enum = collection._NewEnum()
+    except AttributeError:
+        enum = None
+        
+    if enum is None:
+        element_at = get_element_at(collection)
+        
+        for i in range(collection.Count):
+            yield element_at(i)
+        return
+    
+    while True:
+        batch = enum.Next(batch_size)
+        
+        if not batch:
+            return
+        
+        yield from batch
+
+
+def has_text(texts: Iterable[Any]) -> bool:
+    # Verdadeiro se ao menos um texto não for vazio (lê cada texto uma única vez)
+    return any(text is not None and str(text).strip() for text in texts)
+
+
+def unique_keys(titles: Iterable[Any], fallbacks: Iterable[Any]) -> list[Any]:
+    # Chave de cada coluna: o título, ou o identificador da coluna quando o título falta ou
+    # repete um anterior (senão dict(zip(...)) descartaria células); sufixo em último caso
+    keys = []
+    used = set()
     
-    return None if not return_all else []
+    for title, fallback in zip(titles, fallbacks):
+        key = fallback if title is None or title in used else title
+        suffix = 2
+        
+        while key in used:
+            key = f'{title if title is not None else fallback} ({suffix})'
+            suffix += 1
+            
+        used.add(key)
+        keys.append(key)
+        
+    return keys
 
 
 def check_element_attribute(method: Callable):
@@ -96,12 +419,13 @@ def check_element_attribute(method: Callable):
                 raise
             
             msg = e.args[0] if e.args else str(e)
-            match = re.search(r"has no attribute '([^']+)'", msg)
+            _, _, rest = str(msg).partition(_ATTR_MARKER)
+            attribute, quote, _ = rest.partition("'")
             
-            if match:
-                attribute = match.group(1)
-            else:
-                attribute = msg
+            # Formato padrão do Python resolvido só com operações de string; a regex fica de reserva
+            if not (attribute and quote):
+                match = _ATTR_RE.search(str(msg))
+                attribute = match.group(1) if match else msg
                 
             raise SapAttributeNotFoundException(attribute) from e
         